@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+bench_quantize.py – throughput & memory of float vs quantized MoodNet
+---------------------------------------------------------------------
+Run inside the virtual-env:
+
+    python bench_quantize.py --model model/moodnet.keras --rows 1000000
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+import pandas as pd
+
+from moodify.model import MoodNet
+from moodify.quantize import QuantizedMoodNet, compare_models
+
+CSVS = [pathlib.Path("data/train.csv"), pathlib.Path("data/test_playlist.csv")]
+
+
+def tiled_features(net: MoodNet, rows: int) -> pd.DataFrame:
+    """Repeat the real feature rows until we reach *rows* (catalogue-sized)."""
+    cols = list(net.scaler.feature_names_in_)
+    base = pd.concat([pd.read_csv(p)[cols] for p in CSVS], ignore_index=True)
+    reps = -(-rows // len(base))
+    return pd.concat([base] * reps, ignore_index=True).iloc[:rows]
+
+
+def rows_per_sec(predict, X, repeat: int) -> float:
+    predict(X.iloc[:1000])  # warm-up (graph tracing, allocations)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        predict(X)
+        best = min(best, time.perf_counter() - t0)
+    return len(X) / best
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark float vs int8/float16 MoodNet scoring")
+    ap.add_argument("--model", default="model/moodnet.keras", type=pathlib.Path)
+    ap.add_argument("--rows", default=1_000_000, type=int, help="Rows to score per run")
+    ap.add_argument("--repeat", default=3, type=int, help="Timed runs; best is reported")
+    args = ap.parse_args(argv)
+
+    net = MoodNet.load(args.model)
+    X = tiled_features(net, args.rows)
+    float_bytes = sum(w.nbytes for w in net.model.get_weights())
+
+    print(f"{'model':<10}{'rows/s':>14}{'speed-up':>10}{'weights B':>12}{'file B':>10}  agreement (train / test)")
+    base = rows_per_sec(net.predict, X, args.repeat)
+    print(f"{'float32':<10}{base:>14,.0f}{1.0:>10.2f}{float_bytes:>12,}{args.model.stat().st_size:>10,}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for dtype in ("float16", "int8"):
+            qnet = QuantizedMoodNet.from_moodnet(net, dtype=dtype)
+            size = qnet.save(pathlib.Path(tmp) / dtype).stat().st_size
+            rate = rows_per_sec(qnet.predict, X, args.repeat)
+            agree = " / ".join(f"{compare_models(net, qnet, pd.read_csv(p))['agreement']:.4f}" for p in CSVS)
+            print(f"{dtype:<10}{rate:>14,.0f}{rate / base:>10.2f}{qnet.nbytes:>12,}{size:>10,}  {agree}")
+
+
+if __name__ == "__main__":
+    main()
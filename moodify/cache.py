@@ -0,0 +1,185 @@
+"""Disk‑backed Spotify response cache with record / replay modes.
+
+Every Web API call Spotipy makes goes through ``Spotify._internal_call``;
+:class:`CachedSpotify` intercepts it there so pagination, search, and
+playlist authoring are all covered without touching the callers.
+
+Modes
+-----
+``cache``   GET responses are served from disk while younger than their TTL.
+``record``  Always hit Spotify and store every response (a *cassette*).
+``replay``  Never touch the network; serve recorded responses, ignoring TTLs.
+
+User‑scoped endpoints (``me…``, ``users/…``) are additionally keyed by the
+Spotify user id, so one folder can safely hold responses for several
+accounts.  Record mode writes that id to ``account.json`` so replay knows
+which account a cassette belongs to.
+"""
+from __future__ import annotations
+import hashlib, json, os, pathlib, re, tempfile, time
+import spotipy
+
+MODES = ("off", "cache", "record", "replay")
+_DIR = pathlib.Path.home() / ".moodify-http-cache"
+
+# first matching pattern wins – matched against the path after /v1/
+_TTLS: list[tuple[str, int]] = [
+    (r"^audio-features", 30 * 86400),        # features never change
+    (r"^(tracks|artists|albums)\b", 7 * 86400),
+    (r"^search\b", 86400),
+    (r"^playlists/[^/]+/tracks", 3600),
+    (r"^(me|users/[^/]+)/playlists", 300),
+    (r"^me$", 86400),
+]
+_DEFAULT_TTL = 3600
+_USER_SCOPED = re.compile(r"^(me|users)(/|$)")
+
+
+class CassetteMiss(LookupError):
+    """Replay mode asked for a request that was never recorded."""
+
+
+class ResponseCache:
+    """One JSON file per request, keyed by method, endpoint, params & payload.
+
+    Parameters
+    ----------
+    directory : path
+        Where entries live; user‑scoped entries are keyed per account, so
+        several runs (and accounts) can share one folder.
+    mode : str
+        One of ``cache``, ``record`` or ``replay`` (see module docstring).
+    ttls : list[(regex, seconds)] | None
+        Per‑endpoint time‑to‑live overrides, checked before the defaults.
+    account : str | None
+        Spotify user id mixed into user‑scoped keys; resolved lazily by
+        :class:`CachedSpotify` when left as ``None``.
+    """
+
+    def __init__(self, directory: str | pathlib.Path | None = None, *, mode: str = "cache", ttls=None, account: str | None = None):
+        if mode not in MODES[1:]:
+            raise ValueError(f"mode must be one of {', '.join(MODES[1:])}, got {mode!r}")
+        self.dir = pathlib.Path(directory or _DIR)
+        self.mode = mode
+        self.account = account
+        self._ttls = [(re.compile(p), t) for p, t in (ttls or []) + _TTLS]
+
+    # ------------------------------------------------------------------
+    # Keys & TTLs
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """Strip scheme/host/version so relative & absolute URLs share keys."""
+        return re.sub(r"^https?://[^/]+/v\d+/", "", url).strip("/")
+
+    def user_scoped(self, url: str) -> bool:
+        return bool(_USER_SCOPED.match(self.endpoint(url)))
+
+    def key(self, method: str, url: str, params: dict | None, payload=None) -> str:
+        account = self.account if self.user_scoped(url) else None
+        blob = json.dumps(
+            [method.upper(), self.endpoint(url), params or {}, payload, account],
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def ttl(self, url: str) -> int:
+        path = self.endpoint(url)
+        return next((t for rx, t in self._ttls if rx.search(path)), _DEFAULT_TTL)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, *, max_age: float | None = None):
+        """Return ``(hit, response)``; stale entries count as misses."""
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False, None
+        if max_age is not None and time.time() - entry["stored_at"] > max_age:
+            return False, None
+        return True, entry["response"]
+
+    def put(self, key: str, method: str, url: str, params, payload, response):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "method": method, "endpoint": self.endpoint(url), "params": params,
+            "payload": payload, "stored_at": time.time(), "response": response,
+        }
+        # write‑then‑rename so a crashed run never leaves half an entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, default=str)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def save_account(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        (self.dir / "account.json").write_text(json.dumps({"id": self.account}), encoding="utf-8")
+
+    def load_account(self) -> str | None:
+        try:
+            return json.loads((self.dir / "account.json").read_text(encoding="utf-8"))["id"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+
+class CachedSpotify(spotipy.Spotify):
+    """Spotipy client that routes every request through a :class:`ResponseCache`."""
+
+    def __init__(self, cache: ResponseCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def _resolve_account(self):
+        """Pin ``cache.account`` before the first user‑scoped request."""
+        cache = self.cache
+        if cache.account is not None:
+            return
+        if cache.mode == "replay":
+            cache.account = cache.load_account()
+            if cache.account is None:
+                raise CassetteMiss(
+                    f"No account.json in {cache.dir} – record the cassette with --cache-mode record."
+                )
+            return
+        # one uncached lookup per run; the response seeds the cache for "me"
+        me = super()._internal_call("GET", "me/", None, {})
+        cache.account = me["id"]
+        cache.put(cache.key("GET", "me/", {}), "GET", "me/", {}, None, me)
+        if cache.mode == "record":
+            cache.save_account()
+
+    def _internal_call(self, method, url, payload, params):
+        if self.cache.user_scoped(url):
+            self._resolve_account()
+        key = self.cache.key(method, url, params, payload)
+        mode = self.cache.mode
+
+        if mode == "replay":
+            hit, response = self.cache.get(key)
+            if not hit:
+                raise CassetteMiss(
+                    f"No recorded response for {method} {self.cache.endpoint(url)} "
+                    f"in {self.cache.dir} – re-run with --cache-mode record."
+                )
+            return response
+
+        if mode == "cache" and method == "GET":
+            hit, response = self.cache.get(key, max_age=self.cache.ttl(url))
+            if hit:
+                return response
+
+        response = super()._internal_call(method, url, payload, params)
+        if mode == "record" or method == "GET":
+            self.cache.put(key, method, url, params, payload, response)
+        return response
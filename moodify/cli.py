@@ -1,21 +1,56 @@
+import functools
 import pathlib
 import typer
 import pandas as pd
-from typing import List
+from typing import List, Optional
 
 from moodify.auth import CredentialStore
+from moodify.cache import MODES, CassetteMiss, ResponseCache
 from moodify.client import MoodifySession
 from moodify.data import DataBuilder
 from moodify.model import MoodNet
+from moodify.quantize import DTYPES, QuantizedMoodNet, compare_models
 from moodify.recommender import Curator
 
 app = typer.Typer(help="🎧Moodify – mood‑based playlists")
 
+_cache: Optional[ResponseCache] = None
+
+@app.callback()
+def main(
+    cache_mode: str = typer.Option(
+        "off", envvar="MOODIFY_CACHE_MODE",
+        help="Spotify response cache: off, cache (TTL read-through), record, or replay (fully offline)",
+    ),
+    cache_dir: pathlib.Path = typer.Option(
+        None, envvar="MOODIFY_CACHE_DIR", help="Cache / cassette folder (default: ~/.moodify-http-cache)"
+    ),
+):
+    # global options – parsed before any sub‑command runs
+    global _cache
+    if cache_mode not in MODES:
+        raise typer.BadParameter(f"must be one of {', '.join(MODES)}", param_hint="--cache-mode")
+    _cache = None if cache_mode == "off" else ResponseCache(cache_dir, mode=cache_mode)
+
 def get_session() -> MoodifySession:
     """Return an authenticated Spotify session created lazily per command."""
-    return MoodifySession(CredentialStore())
+    if _cache is not None and _cache.mode == "replay":
+        return MoodifySession(cache=_cache)
+    return MoodifySession(CredentialStore(), cache=_cache)
+
+def offline_errors(fn):
+    """Turn a replay miss into a one‑line error instead of a traceback."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except CassetteMiss as e:
+            typer.echo(f"⚠️  {e}", err=True)
+            raise typer.Exit(code=1)
+    return wrapper
 
 @app.command(help="List your Spotify playlists. Add --mine to show only those you own.")
+@offline_errors
 def playlists(
     owned_only: bool = typer.Option(False, "--mine", help="Only show playlists you own"),
 ):
@@ -27,6 +62,7 @@ def playlists(
 @app.command(
     help="Build a labelled CSV by harvesting tracks from playlists whose titles contain the given mood words (Recommended: Happy, Sad, Energetic, or Calm)."
 )
+@offline_errors
 def build_dataset(
     moods: List[str] = typer.Argument(..., metavar="MOODS", help="One or more mood words"),
     out: pathlib.Path = typer.Option("data/train.csv", help="Destination CSV file (default: dataset/train.csv)"),
@@ -126,7 +162,58 @@ def train(
     print(f"Validation accuracy: {net.val_accuracy:.3f}")
     typer.echo(f"✅  Model weights saved → {save}")
 
+@app.command(help="Export a trained MoodNet with int8 or float16 weights for fast CPU scoring.")
+def quantize(
+    model_path: pathlib.Path = typer.Option("model/moodnet.keras", help="Trained model path"),
+    dtype: str = typer.Option("int8", help="Weight precision: int8 or float16"),
+    out: pathlib.Path = typer.Option(None, help="Destination .qnet file (default: next to the model)"),
+    check: List[pathlib.Path] = typer.Option(
+        ["data/train.csv", "data/test_playlist.csv"], "--check", help="CSV(s) to compare float vs quantized predictions on"
+    ),
+    min_agreement: float = typer.Option(0.98, help="Fail if prediction agreement on any --check CSV drops below this"),
+):
+    """Quantize **MoodNet** and verify it still predicts like the float model.
+
+    **What it does**
+    1. Loads the `.keras` model and its `.meta` scaler/encoder.
+    2. Quantizes each Dense kernel to int8 with one scale per output channel
+       (or to float16).
+    3. Scores every `--check` CSV with both models and prints the fraction of
+       rows on which they agree (plus accuracy when a `mood` column exists).
+    4. Writes a single `.qnet` file only if every check passes.
+
+    Example
+    -------
+    ```bash
+    moodify quantize --dtype int8 --out model/moodnet_int8.qnet
+    moodify curate Calm --csv data/test_playlist.csv --model-path model/moodnet_int8.qnet
+    ```
+    """
+    if dtype not in DTYPES:
+        raise typer.BadParameter(f"must be one of {', '.join(DTYPES)}", param_hint="--dtype")
+
+    net = MoodNet.load(model_path)
+    qnet = QuantizedMoodNet.from_moodnet(net, dtype=dtype)
+
+    failed = False
+    for path in check:
+        report = compare_models(net, qnet, pd.read_csv(path))
+        line = f"{path}: agreement {report['agreement']:.4f} over {int(report['rows'])} rows"
+        if "float_acc" in report:
+            line += f" | accuracy float {report['float_acc']:.4f} → {dtype} {report['quant_acc']:.4f}"
+        typer.echo(line)
+        failed |= report["agreement"] < min_agreement
+
+    # only write the artefact once it has passed, so curate can't pick up a bad one
+    if failed:
+        typer.echo(f"⚠️  Agreement below {min_agreement} – nothing saved; keep using the float model.", err=True)
+        raise typer.Exit(code=1)
+
+    dest = qnet.save(out or model_path.with_name(f"{model_path.stem}_{dtype}.qnet"))
+    typer.echo(f"✅  Quantized model ({qnet.nbytes} bytes of weights) saved → {dest}")
+
 @app.command(help="Filter a live playlist *or* a pre-built CSV by predicted mood.")
+@offline_errors
 def curate(
     mood: str = typer.Argument(..., help="Target mood to keep (Happy, Sad, etc.)"),
     # mutually-exclusive source options
@@ -134,7 +221,7 @@ def curate(
     csv: pathlib.Path = typer.Option(None, "--csv", exists=True, help="Pre-built CSV to filter"),
     name: str = typer.Option("", help="Custom name for the new playlist"),
     public: bool = typer.Option(True, help="Make playlist public (default true)"),
-    model_path: pathlib.Path = typer.Option("model/moodnet.keras", help="Trained model path"),
+    model_path: pathlib.Path = typer.Option("model/moodnet.keras", help="Trained model path (.keras or quantized .qnet)"),
 ):
     """
     Create a mood-filtered playlist.
@@ -148,7 +235,7 @@ def curate(
     moodify curate Sad --csv data/my_mix.csv --name "Offline Sad Mix"
     """
     sess = get_session()
-    net = MoodNet.load(model_path)
+    net = QuantizedMoodNet.load(model_path) if model_path.suffix == ".qnet" else MoodNet.load(model_path)
 
     curator = Curator(sess, net)
     pl_id, n = curator.curate_playlist(
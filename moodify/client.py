@@ -2,12 +2,18 @@
 from __future__ import annotations
 import spotipy
 from .auth import CredentialStore
+from .cache import CachedSpotify, ResponseCache
 
 class MoodifySession:
     """A very small façade so the rest of the app never sees Spotipy."""
 
-    def __init__(self, store: CredentialStore | None = None):
-        self._sp = spotipy.Spotify(auth=store.token())
+    def __init__(self, store: CredentialStore | None = None, *, cache: ResponseCache | None = None):
+        if cache is None:
+            self._sp = spotipy.Spotify(auth=store.token())
+        elif cache.mode == "replay":  # offline – no token, no browser
+            self._sp = CachedSpotify(cache)
+        else:
+            self._sp = CachedSpotify(cache, auth=store.token())
 
     # ─── User Info ──────────────────────────────────────────────────────────
     def profile(self):
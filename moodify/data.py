@@ -38,10 +38,9 @@ class DataBuilder:
 
     # ── Infer dominant genre from artist profile ────────────────────────
     def add_genre(self, df: pd.DataFrame) -> pd.DataFrame:
-        import itertools, spotipy  # local import to keep top clean
         genres: list[list[str]] = []
         seen: dict[str, list[str]] = {}
-        sp = spotipy.Spotify(auth_manager=self.sess._sp.auth_manager)
+        sp = self.sess._sp  # reuse the session's client (and its response cache)
         for artist in df["artist"]:
             if artist in seen:
                 genres.append(seen[artist])
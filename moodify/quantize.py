@@ -0,0 +1,194 @@
+"""Low‑precision export of a trained MoodNet for bulk CPU scoring.
+
+The MLP is tiny (9→64→32→N), so for catalogue‑sized batches the cost of
+``MoodNet.predict`` is dominated by Keras/TensorFlow dispatch rather than
+arithmetic.  :class:`QuantizedMoodNet` keeps the Dense weights as int8 (with one
+float32 scale per output channel) or float16 and scores rows with plain NumPy
+matrix products.
+"""
+from __future__ import annotations
+import pathlib, joblib
+from typing import TYPE_CHECKING
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:  # keep this module importable without TensorFlow
+    from .model import MoodNet
+
+DTYPES = ("int8", "float16")
+_ACTIVATIONS = {
+    "relu": lambda z: np.maximum(z, 0.0, out=z),
+    "linear": lambda z: z,
+    "softmax": lambda z: z,  # final layer only: argmax is unchanged; probabilities via predict_proba
+}
+
+
+class QuantizedMoodNet:
+    """NumPy‑only stand‑in for :class:`MoodNet` with low‑precision weights.
+
+    Exposes the same :py:meth:`predict` signature, so it can be handed to
+    :class:`~moodify.recommender.Curator` in place of the float model.
+
+    Attributes
+    ----------
+    dtype : str
+        Storage type of the Dense kernels – ``"int8"`` or ``"float16"``.
+    layers : list[dict]
+        One entry per Dense layer with ``kernel``, ``scale`` (int8 only),
+        ``bias`` and ``activation``.
+    scaler, encoder
+        The fitted MinMaxScaler / LabelEncoder copied from the float model.
+    """
+
+    def __init__(self, layers: list[dict], scaler, encoder, *, dtype: str = "int8"):
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {', '.join(DTYPES)}, got {dtype!r}")
+        self.layers = layers
+        self.scaler = scaler
+        self.encoder = encoder
+        self.dtype = dtype
+        # MinMaxScaler is an affine map – apply it directly instead of
+        # going through sklearn's per‑call validation.
+        self._scale = np.asarray(scaler.scale_, dtype=np.float32)
+        self._min = np.asarray(scaler.min_, dtype=np.float32)
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_moodnet(cls, net: MoodNet, *, dtype: str = "int8"):
+        """Quantize every Dense layer of a trained *net*."""
+        if net.model is None:
+            raise ValueError("MoodNet has no trained model – call fit() or load() first.")
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {', '.join(DTYPES)}, got {dtype!r}")
+
+        layers = []
+        for layer in net.model.layers:
+            weights = layer.get_weights()
+            if type(layer).__name__ != "Dense":
+                if weights:  # e.g. BatchNormalization – would silently change outputs
+                    raise ValueError(f"Cannot export {type(layer).__name__} layer {layer.name!r}; only Dense layers carry weights.")
+                continue
+            kernel, bias = (np.asarray(w, dtype=np.float32) for w in weights)
+            activation = layer.get_config().get("activation", "linear")
+            if activation not in _ACTIVATIONS:
+                raise ValueError(f"Unsupported activation for export: {activation!r}")
+            if layers and layers[-1]["activation"] == "softmax":
+                raise ValueError("softmax is only supported on the final Dense layer.")
+            entry = {"bias": bias, "activation": activation}
+            if dtype == "int8":
+                entry["kernel"], entry["scale"] = _quantize_int8(kernel)
+            else:
+                entry["kernel"], entry["scale"] = kernel.astype(np.float16), None
+            layers.append(entry)
+        return cls(layers, net.scaler, net.encoder, dtype=dtype)
+
+    # ------------------------------------------------------------------
+    # Persistence helpers
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | pathlib.Path):
+        """Write weights, scaler, and encoder to a single ``.qnet`` file."""
+        path = pathlib.Path(path).with_suffix(".qnet")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(
+            {"dtype": self.dtype, "layers": self.layers,
+             "scaler": self.scaler, "encoder": self.encoder},
+            path,
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str | pathlib.Path):
+        blob = joblib.load(pathlib.Path(path))
+        return cls(blob["layers"], blob["scaler"], blob["encoder"], dtype=blob["dtype"])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by kernels, scales, and biases."""
+        return sum(
+            l["kernel"].nbytes + l["bias"].nbytes + (l["scale"].nbytes if l["scale"] is not None else 0)
+            for l in self.layers
+        )
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def _features(self, features: pd.DataFrame | np.ndarray) -> np.ndarray:
+        if isinstance(features, pd.DataFrame):
+            cols = getattr(self.scaler, "feature_names_in_", None)
+            if cols is not None:
+                features = features[list(cols)]
+            features = features.to_numpy()
+        X = np.asarray(features, dtype=np.float32)
+        return X * self._scale + self._min
+
+    def _forward(self, X: np.ndarray) -> np.ndarray:
+        for l in self.layers:
+            # per‑output‑channel scale factors out of the matmul:
+            # X @ (Wq * s) == (X @ Wq) * s
+            Z = X @ l["kernel"].astype(np.float32)
+            if l["scale"] is not None:
+                Z *= l["scale"]
+            Z += l["bias"]
+            X = _ACTIVATIONS[l["activation"]](Z)
+        return X
+
+    def predict_proba(self, features: pd.DataFrame | np.ndarray, *, batch_size: int = 65536) -> np.ndarray:
+        """Return softmax class probabilities for each row in *features*."""
+        X = self._features(features)
+        out = np.empty((len(X), len(self.encoder.classes_)), dtype=np.float32)
+        for i in range(0, len(X), batch_size):
+            Z = self._forward(X[i : i + batch_size])
+            Z -= Z.max(axis=1, keepdims=True)
+            np.exp(Z, out=Z)
+            out[i : i + batch_size] = Z / Z.sum(axis=1, keepdims=True)
+        return out
+
+    def predict(self, features: pd.DataFrame | np.ndarray, *, batch_size: int = 65536):
+        """Return the **string** mood prediction for each row in *features*."""
+        X = self._features(features)
+        preds = np.empty(len(X), dtype=np.int64)
+        for i in range(0, len(X), batch_size):
+            preds[i : i + batch_size] = np.argmax(self._forward(X[i : i + batch_size]), axis=1)
+        return self.encoder.inverse_transform(preds)
+
+
+def _quantize_int8(kernel: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per‑output‑channel int8 quantization of a (in, out) kernel."""
+    scale = np.abs(kernel).max(axis=0) / 127.0
+    scale[scale == 0] = 1.0
+    q = np.clip(np.rint(kernel / scale), -127, 127).astype(np.int8)
+    return q, scale.astype(np.float32)
+
+
+def compare_models(
+    float_net: MoodNet,
+    quant_net: QuantizedMoodNet,
+    df: pd.DataFrame,
+    *,
+    label_col: str = "mood",
+) -> dict[str, float]:
+    """Score *df* with both models and report how closely they agree.
+
+    Returns ``agreement`` (fraction of rows with identical predictions) and,
+    when *df* has a *label_col*, ``float_acc`` / ``quant_acc`` against it.
+    """
+    cols = list(float_net.scaler.feature_names_in_)
+    missing = set(cols) - set(df.columns)
+    if missing:
+        raise ValueError(f"CSV missing feature columns: {', '.join(sorted(missing))}")
+    feats = df[cols]
+    ref = np.asarray(float_net.predict(feats))
+    got = np.asarray(quant_net.predict(feats))
+
+    report = {"rows": float(len(df)), "agreement": float(np.mean(ref == got))}
+    if label_col in df.columns:
+        # case‑fold so "calm" == "Calm" like Curator does
+        truth = df[label_col].astype(str).str.lower().str.strip().to_numpy()
+        report["float_acc"] = float(np.mean(np.char.lower(ref.astype(str)) == truth))
+        report["quant_acc"] = float(np.mean(np.char.lower(got.astype(str)) == truth))
+    return report
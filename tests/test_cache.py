@@ -0,0 +1,154 @@
+"""ResponseCache / CachedSpotify with Spotipy's transport stubbed out (no network)."""
+import json
+import pytest
+import spotipy
+
+from moodify.cache import CachedSpotify, CassetteMiss, ResponseCache
+from moodify.client import MoodifySession
+
+
+class FakeSpotify:
+    """Stands in for ``spotipy.Spotify._internal_call`` and counts requests."""
+
+    def __init__(self, user="alice"):
+        self.user = user
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, sp, method, url, payload, params):
+        self.calls.append((method, url))
+        if url.strip("/") == "me":
+            return {"id": self.user}
+        if url == "me/playlists":
+            return {"items": [{"name": f"{self.user}'s mix", "owner": {"id": self.user}}]}
+        if method == "POST":
+            return {"id": "new-playlist", "payload": payload}
+        return {"url": url, "params": params}
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    stub = FakeSpotify()
+    monkeypatch.setattr(spotipy.Spotify, "_internal_call", lambda sp, *args: stub(sp, *args))
+    return stub
+
+
+def offline(monkeypatch):
+    def boom(*args, **kwargs):
+        raise AssertionError("network used in replay mode")
+    monkeypatch.setattr(spotipy.Spotify, "_internal_call", boom)
+
+
+# ── Keys & TTLs ─────────────────────────────────────────────────────────
+@pytest.mark.parametrize("url, ttl", [
+    ("audio-features/?ids=a,b", 30 * 86400),
+    ("tracks/abc", 7 * 86400),
+    ("search", 86400),
+    ("playlists/xyz/tracks", 3600),
+    ("me/playlists", 300),
+    ("users/bob/playlists", 300),
+    ("me/", 86400),
+    ("browse/categories", 3600),  # default
+])
+def test_ttl_per_endpoint(tmp_path, url, ttl):
+    assert ResponseCache(tmp_path).ttl(url) == ttl
+
+
+def test_absolute_and_relative_urls_share_a_key(tmp_path):
+    cache = ResponseCache(tmp_path)
+    rel = cache.key("GET", "playlists/xyz/tracks", {"offset": 100, "limit": 100})
+    absolute = cache.key("get", "https://api.spotify.com/v1/playlists/xyz/tracks", {"limit": 100, "offset": 100})
+    assert rel == absolute
+    assert rel != cache.key("GET", "playlists/xyz/tracks", {"offset": 200, "limit": 100})
+
+
+def test_user_scoped_keys_include_account(tmp_path):
+    alice = ResponseCache(tmp_path, account="alice")
+    bob = ResponseCache(tmp_path, account="bob")
+    assert alice.key("GET", "me/playlists", {}) != bob.key("GET", "me/playlists", {})
+    assert alice.key("GET", "tracks/abc", {}) == bob.key("GET", "tracks/abc", {})
+
+
+# ── cache mode ──────────────────────────────────────────────────────────
+def test_cache_mode_serves_warm_gets_from_disk(tmp_path, fake):
+    sp = CachedSpotify(ResponseCache(tmp_path))
+    first = sp._internal_call("GET", "tracks/abc", None, {})
+    again = CachedSpotify(ResponseCache(tmp_path))._internal_call("GET", "tracks/abc", None, {})
+    assert first == again
+    assert fake.calls == [("GET", "tracks/abc")]
+
+
+def test_cache_mode_refetches_stale_entries(tmp_path, fake):
+    cache = ResponseCache(tmp_path, ttls=[(r"^tracks", 0)])
+    sp = CachedSpotify(cache)
+    sp._internal_call("GET", "tracks/abc", None, {})
+    sp._internal_call("GET", "tracks/abc", None, {})
+    assert len(fake.calls) == 2
+
+
+def test_cache_mode_never_serves_writes_from_disk(tmp_path, fake):
+    sp = CachedSpotify(ResponseCache(tmp_path))
+    for _ in range(2):
+        sp._internal_call("POST", "playlists/xyz/tracks", {"uris": ["a"]}, {})
+    assert fake.calls.count(("POST", "playlists/xyz/tracks")) == 2
+
+
+def test_cache_is_per_account(tmp_path, fake):
+    alice = CachedSpotify(ResponseCache(tmp_path))
+    assert alice._internal_call("GET", "me/playlists", None, {})["items"][0]["owner"]["id"] == "alice"
+
+    fake.user = "bob"
+    bob = CachedSpotify(ResponseCache(tmp_path))
+    assert bob._internal_call("GET", "me/", None, {})["id"] == "bob"
+    assert bob._internal_call("GET", "me/playlists", None, {})["items"][0]["owner"]["id"] == "bob"
+
+
+# ── record / replay ─────────────────────────────────────────────────────
+def test_record_then_replay_offline(tmp_path, fake, monkeypatch):
+    rec = MoodifySession.__new__(MoodifySession)
+    rec._sp = CachedSpotify(ResponseCache(tmp_path, mode="record"))
+    names = [p["name"] for p in rec.playlists()]
+    tracks = rec._sp._internal_call("GET", "playlists/xyz/tracks", None, {"limit": 100, "offset": 0})
+    pl_id = rec.create_playlist("Calm mix", "desc", public=True)
+    assert json.loads((tmp_path / "account.json").read_text())["id"] == "alice"
+
+    offline(monkeypatch)
+    sess = MoodifySession(cache=ResponseCache(tmp_path, mode="replay"))
+    assert [p["name"] for p in sess.playlists()] == names
+    assert sess._sp._internal_call("GET", "playlists/xyz/tracks", None, {"limit": 100, "offset": 0}) == tracks
+    assert sess.create_playlist("Calm mix", "desc", public=True) == pl_id
+
+
+def test_replay_miss_raises(tmp_path, monkeypatch):
+    offline(monkeypatch)
+    sp = CachedSpotify(ResponseCache(tmp_path, mode="replay"))
+    with pytest.raises(CassetteMiss, match="tracks/abc"):
+        sp._internal_call("GET", "tracks/abc", None, {})
+    with pytest.raises(CassetteMiss, match="account.json"):
+        sp._internal_call("GET", "me/playlists", None, {})
+
+
+# ── storage ─────────────────────────────────────────────────────────────
+def test_put_is_atomic(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path)
+    key = cache.key("GET", "tracks/abc", {})
+    cache.put(key, "GET", "tracks/abc", {}, None, {"v": 1})
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(json, "dump", broken)
+    with pytest.raises(OSError):
+        cache.put(key, "GET", "tracks/abc", {}, None, {"v": 2})
+
+    assert cache.get(key) == (True, {"v": 1})
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_cli_replay_miss_exits_cleanly(tmp_path):
+    pytest.importorskip("tensorflow")  # cli imports the Keras model
+    from typer.testing import CliRunner
+    from moodify.cli import app
+
+    result = CliRunner().invoke(app, ["--cache-mode", "replay", "--cache-dir", str(tmp_path), "playlists"])
+    assert result.exit_code == 1
+    assert "record" in result.output
+    assert not isinstance(result.exception, CassetteMiss)
@@ -0,0 +1,145 @@
+"""QuantizedMoodNet against a NumPy stand‑in for the Keras model (no TensorFlow)."""
+import pathlib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import MinMaxScaler, LabelEncoder
+
+from moodify.quantize import QuantizedMoodNet, _quantize_int8, compare_models
+
+DATA = pathlib.Path(__file__).resolve().parents[1] / "data"
+FEATURES = [
+    "acousticness", "danceability", "energy", "instrumentalness", "liveness",
+    "loudness", "speechiness", "tempo", "valence",
+]
+
+
+# ── Fakes mirroring the bits of the Keras API that from_moodnet touches ──
+class InputLayer:
+    name = "input"
+
+    def get_weights(self):
+        return []
+
+
+class Dense:
+    def __init__(self, kernel, bias, activation, name="dense"):
+        self.kernel, self.bias, self.activation, self.name = kernel, bias, activation, name
+
+    def get_weights(self):
+        return [self.kernel, self.bias]
+
+    def get_config(self):
+        return {"activation": self.activation}
+
+
+class BatchNormalization(InputLayer):
+    name = "bn"
+
+    def get_weights(self):
+        return [np.ones(4)] * 4
+
+
+class _Model:
+    def __init__(self, layers):
+        self.layers = layers
+
+
+class FloatNet:
+    """Plays the role of MoodNet: same attributes, float32 NumPy forward pass."""
+
+    def __init__(self, layers, scaler, encoder):
+        self.model, self.scaler, self.encoder = _Model(layers), scaler, encoder
+
+    def predict(self, features):
+        X = self.scaler.transform(features)
+        for l in self.model.layers[1:]:
+            X = X @ l.kernel + l.bias
+            if l.activation == "relu":
+                X = np.maximum(X, 0)
+        return self.encoder.inverse_transform(np.argmax(X, axis=1))
+
+
+@pytest.fixture(scope="module")
+def train():
+    return pd.read_csv(DATA / "train.csv")
+
+
+@pytest.fixture(scope="module")
+def net(train):
+    rng = np.random.default_rng(0)
+    scaler = MinMaxScaler().fit(train[FEATURES])
+    encoder = LabelEncoder().fit(train["mood"].str.title())
+    dims = [len(FEATURES), 64, 32, len(encoder.classes_)]
+    acts = ["relu", "relu", "softmax"]
+    layers = [InputLayer()] + [
+        Dense(rng.normal(0, 1, (i, o)).astype(np.float32), rng.normal(0, 0.1, o).astype(np.float32), a)
+        for i, o, a in zip(dims, dims[1:], acts)
+    ]
+    return FloatNet(layers, scaler, encoder)
+
+
+def test_int8_per_channel_quantization():
+    kernel = np.array([[0.5, -2.0, 0.0], [-1.0, 1.0, 0.0]], dtype=np.float32)
+    q, scale = _quantize_int8(kernel)
+    assert q.dtype == np.int8
+    np.testing.assert_allclose(scale, [1.0 / 127, 2.0 / 127, 1.0])  # zero column keeps scale 1
+    assert np.abs(q).max(axis=0).tolist() == [127, 127, 0]
+    assert np.all(np.abs(q * scale - kernel) <= scale / 2 + 1e-7)
+
+
+@pytest.mark.parametrize("dtype, min_agreement", [("float16", 0.999), ("int8", 0.97)])
+def test_agrees_with_float_model(net, train, dtype, min_agreement):
+    qnet = QuantizedMoodNet.from_moodnet(net, dtype=dtype)
+    for df in (train, pd.read_csv(DATA / "test_playlist.csv")):
+        assert compare_models(net, qnet, df)["agreement"] >= min_agreement
+
+
+def test_predict_proba_rows_sum_to_one(net, train):
+    proba = QuantizedMoodNet.from_moodnet(net).predict_proba(train[FEATURES])
+    assert proba.shape == (len(train), len(net.encoder.classes_))
+    np.testing.assert_allclose(proba.sum(axis=1), 1.0, rtol=1e-5)
+
+
+def test_save_load_round_trip(net, train, tmp_path):
+    qnet = QuantizedMoodNet.from_moodnet(net)
+    path = qnet.save(tmp_path / "moodnet_int8.keras")
+    assert path.suffix == ".qnet"
+    loaded = QuantizedMoodNet.load(path)
+    assert loaded.dtype == "int8" and loaded.nbytes == qnet.nbytes
+    assert (loaded.predict(train[FEATURES]) == qnet.predict(train[FEATURES])).all()
+
+
+def test_memory_footprint(net):
+    n_w = sum(l.kernel.size for l in net.model.layers[1:])
+    n_out = sum(l.bias.size for l in net.model.layers[1:])
+    assert QuantizedMoodNet.from_moodnet(net, dtype="int8").nbytes == n_w + 8 * n_out
+    assert QuantizedMoodNet.from_moodnet(net, dtype="float16").nbytes == 2 * n_w + 4 * n_out
+
+
+def test_compare_models_case_folds_labels(net, train):
+    # train.csv labels are lower‑case while the encoder classes are title‑case
+    report = compare_models(net, QuantizedMoodNet.from_moodnet(net), train)
+    truth = train["mood"].str.lower().to_numpy()
+    expected = np.mean(np.char.lower(net.predict(train[FEATURES]).astype(str)) == truth)
+    assert report["float_acc"] == pytest.approx(expected)
+    assert "float_acc" not in compare_models(net, QuantizedMoodNet.from_moodnet(net), train.drop(columns="mood"))
+
+
+def test_rejects_invalid_dtype(net):
+    with pytest.raises(ValueError, match="dtype"):
+        QuantizedMoodNet.from_moodnet(net, dtype="int4")
+
+
+def test_rejects_non_dense_layer_with_weights(net):
+    bad = FloatNet(net.model.layers[:2] + [BatchNormalization()] + net.model.layers[2:], net.scaler, net.encoder)
+    with pytest.raises(ValueError, match="BatchNormalization"):
+        QuantizedMoodNet.from_moodnet(bad)
+
+
+def test_rejects_softmax_before_final_layer(net):
+    first = net.model.layers[1]
+    hidden_softmax = Dense(first.kernel, first.bias, "softmax")
+    bad = FloatNet([InputLayer(), hidden_softmax] + net.model.layers[2:], net.scaler, net.encoder)
+    with pytest.raises(ValueError, match="softmax"):
+        QuantizedMoodNet.from_moodnet(bad)